@@ -0,0 +1,58 @@
+# 10/19/26
+# benchmarks/fast_mode.py
+"""Compares the time per call of each recipe with fast mode disabled and enabled.
+
+Usage: python benchmarks/fast_mode.py [--number N]
+"""
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from recipes import Guard, Tuple, curry, fast_mode, pipefunc
+from recipes.utils import require
+
+@pipefunc
+def inc(x):
+    return x + 1
+
+@curry
+def add(a, b, c):
+    return a + b + c
+
+add2 = add(1)(1)
+guarded = Guard(0, int)
+
+cases = {
+    "require": lambda: require(True),
+    "pipefunc": lambda: 1 | inc,
+    "curry": lambda: add2(1),
+    "Guard.guard read": lambda: guarded.guard,
+    "Guard.value assign": lambda: setattr(guarded, "value", 1),
+    "Tuple": lambda: Tuple(1, x=2, y=3),
+}
+
+def measure(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    previous = fast_mode()
+    print(f"{'recipe':<20}{'checked (ns)':>14}{'fast (ns)':>12}{'speedup':>10}")
+    try:
+        for name, func in cases.items():
+            fast_mode(False)
+            checked = measure(func, args.number)
+            fast_mode(True)
+            fast = measure(func, args.number)
+            print(f"{name:<20}{checked * 1e9:>14.1f}{fast * 1e9:>12.1f}{checked / fast:>9.2f}x")
+    finally:
+        fast_mode(previous)
+
+if __name__ == "__main__":
+    main()
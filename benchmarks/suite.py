@@ -0,0 +1,219 @@
+# 10/19/26
+# benchmarks/suite.py
+"""Benchmarks each recipe against a plain Python baseline at several input sizes.
+
+Results are stored as JSON with --save. When compared with a saved baseline using
+--compare, any benchmark whose time relative to its plain Python baseline grew by
+more than --threshold is reported and the exit status is 1. Comparing relative
+times rather than absolute ones keeps results comparable between machines.
+
+Usage: python benchmarks/suite.py [--sizes 10 100 1000] [--save FILE]
+                                  [--compare FILE] [--threshold 0.1]
+"""
+from __future__ import annotations
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+from collections import namedtuple
+from collections.abc import Mapping, Sequence, Set
+from functools import partial
+from numbers import Number
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from recipes import Guard, Tuple, asdict, curry, infixed, pipefunc
+
+# benchmark name -> function taking an input size and returning the recipe
+# and baseline callables, which both perform `size` operations
+benchmarks: dict[str, Callable[[int], tuple[Callable, Callable]]] = {}
+
+def benchmark(name: str):
+    def register(func):
+        benchmarks[name] = func
+        return func
+    return register
+
+Point = namedtuple("Point", "x y z")
+
+@benchmark("tuple.construct")
+def tuple_construct(size):
+    values = range(size)
+    recipe = lambda: [Tuple(x=i, y=i, z=i) for i in values]
+    baseline = lambda: [Point(x=i, y=i, z=i) for i in values]
+    return recipe, baseline
+
+@benchmark("tuple.hash")
+def tuple_hash(size):
+    records = [Tuple(x=i, y=i, z=i) for i in range(size)]
+    points = [Point(i, i, i) for i in range(size)]
+    return lambda: [hash(r) for r in records], lambda: [hash(p) for p in points]
+
+@benchmark("tuple.asdict")
+def tuple_asdict(size):
+    records = [Tuple(x=i, y=i, z=i) for i in range(size)]
+    points = [Point(i, i, i) for i in range(size)]
+    return lambda: [asdict(r) for r in records], lambda: [p._asdict() for p in points]
+
+class Checked:
+    "Plain Python equivalent of Guard(value, int)."
+    __slots__ = "_value",
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        if not isinstance(value, int):
+            raise ValueError("Value does not pass guard")
+        self._value = value
+
+@benchmark("guard.assign")
+def guard_assign(size):
+    guarded, checked = Guard(0, int), Checked()
+    values = range(size)
+
+    def recipe():
+        for i in values:
+            guarded.value = i
+
+    def baseline():
+        for i in values:
+            checked.value = i
+
+    return recipe, baseline
+
+unions = {
+    5: int | float | complex | str | bytes,
+    10: int | float | complex | str | bytes | Number | Mapping | Sequence | Set | type(None),
+}
+
+def guard_union(union, size):
+    check = Guard(0, union).guard
+    kinds = [1, "", b"", {}, (), frozenset(), None, ..., object()]
+    values = [kinds[i % len(kinds)] for i in range(size)]
+    return lambda: [check(v) for v in values], lambda: [isinstance(v, union) for v in values]
+
+for members, union in unions.items():
+    benchmark(f"guard.union{members}")(partial(guard_union, union))
+
+@benchmark("infix.dispatch")
+def infix_dispatch(size):
+    def concat(a, b):
+        return a + b
+    infix = infixed(concat)
+    values = range(size)
+    return lambda: [i |infix| i for i in values], lambda: [concat(i, i) for i in values]
+
+def add(a, b, c):
+    return a + b + c
+
+@benchmark("curry.partial")
+def curry_partial(size):
+    curried = curry(add)
+    values = range(size)
+    return lambda: [curried(i) for i in values], lambda: [partial(add, i) for i in values]
+
+@benchmark("curry.saturate")
+def curry_saturate(size):
+    curried = curry(add)(1, 2)
+    values = range(size)
+    return lambda: [curried(i) for i in values], lambda: [add(1, 2, i) for i in values]
+
+@benchmark("pipefunc.chain")
+def pipefunc_chain(size):
+    def inc(x):
+        return x + 1
+    def double(x):
+        return x * 2
+    def neg(x):
+        return -x
+    f, g, h = pipefunc(inc), pipefunc(double), pipefunc(neg)
+    values = range(size)
+    return lambda: [i | f | g | h for i in values], lambda: [neg(double(inc(i))) for i in values]
+
+def measure(func: Callable, repeat: int) -> float:
+    number, elapsed = 1, 0.0
+    # scale the number of loops so each measurement takes at least 20ms
+    while True:
+        elapsed = timeit.timeit(func, number=number)
+        if elapsed >= 0.02:
+            break
+        number *= 2 if elapsed > 0.002 else 10
+    return min([elapsed, *timeit.repeat(func, number=number, repeat=repeat - 1)]) / number
+
+def run(sizes: list[int], repeat: int, selected: list[str] | None=None) -> dict:
+    results = {}
+    for name, setup in benchmarks.items():
+        if selected and not any(name.startswith(prefix) for prefix in selected):
+            continue
+        for size in sizes:
+            recipe, baseline = setup(size)
+            recipe_time = measure(recipe, repeat)
+            baseline_time = measure(baseline, repeat)
+            results[f"{name}[{size}]"] = {
+                "benchmark": name, "size": size,
+                "seconds": recipe_time, "baseline": baseline_time,
+                "ratio": recipe_time / baseline_time,
+            }
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+def compare(current: dict, saved: dict, threshold: float) -> list[str]:
+    "Returns a message for each benchmark whose ratio to its baseline regressed."
+    regressions = []
+    for key, result in current["results"].items():
+        previous = saved["results"].get(key)
+        if previous is None:
+            continue
+        change = result["ratio"] / previous["ratio"] - 1
+        if change > threshold:
+            regressions.append(
+                f"{key}: {previous['ratio']:.2f}x -> {result['ratio']:.2f}x baseline ({change:+.0%})"
+            )
+    return regressions
+
+def report(results: dict) -> None:
+    print(f"{'benchmark':<26}{'recipe (us)':>14}{'baseline (us)':>15}{'ratio':>9}")
+    for key, result in results["results"].items():
+        print(f"{key:<26}{result['seconds'] * 1e6:>14.1f}"
+            f"{result['baseline'] * 1e6:>15.1f}{result['ratio']:>8.2f}x")
+
+def main(argv: list[str] | None=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", nargs="+", metavar="PREFIX",
+        help="only run benchmarks whose names start with one of the prefixes")
+    parser.add_argument("--save", type=Path, help="write the results as JSON")
+    parser.add_argument("--compare", type=Path, help="compare with saved JSON results")
+    parser.add_argument("--threshold", type=float, default=0.1,
+        help="relative slowdown reported as a regression (default: 0.1)")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.repeat, args.only)
+    report(results)
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2))
+    if args.compare:
+        regressions = compare(results, json.loads(args.compare.read_text()), args.threshold)
+        for message in regressions:
+            print(f"regression: {message}")
+        if regressions:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,28 @@
-from .recipes import *
-from .tuples import Tuple, fields, asdict, items
-from .guards import BaseGuard, Guard, PartialGuard, guard
-from .infix import BaseInfix, Infix, infixed, new_infix, operator_method
-from .utils import Nil
+# Submodules are imported on first attribute access (PEP 562), so that importing
+# a single recipe doesn't pay for the others.
+_exports = {
+    "recipes": ("pipefunc", "curry"),
+    "tuples": ("Tuple", "fields", "asdict", "items", "memory_report"),
+    "guards": ("BaseGuard", "Guard", "PartialGuard", "TypeGuard", "guard"),
+    "infix": ("BaseInfix", "Infix", "infixed", "new_infix", "operator_method"),
+    "utils": ("Nil", "fast_mode"),
+    "profiling": ("Profiler", "StageStats", "profiler"),
+    "compiler": ("compile",),
+    "records": ("RecordFile", "read_records", "write_records"),
+}
+
+_modules = {name: module for module, names in _exports.items() for name in names}
+
+# compile is only available as recipes.compile, since star imports would shadow the builtin
+__all__ = tuple(name for name in _modules if name != "compile")
+
+def __getattr__(name):
+    module = _modules.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(__import__(f"{__name__}.{module}", fromlist=[name]), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted({*globals(), *_modules})
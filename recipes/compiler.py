@@ -0,0 +1,153 @@
+# 10/19/26
+# compiler.py
+from __future__ import annotations
+import builtins
+import inspect
+from functools import partial
+from typing import Any, Callable
+from .infix import BaseInfix
+from .recipes import Function, curry
+
+__all__ = "compile",
+
+PREFIX = "_recipes_"
+
+# generated factory functions, keyed by their source code
+_factories: dict[str, Callable] = {}
+
+def _factory(source: str, name: str) -> Callable:
+    factory = _factories.get(source)
+    if factory is None:
+        namespace: dict[str, Any] = {}
+        exec(builtins.compile(source, f"<recipes.compile {name}>", "exec"), namespace)
+        factory = _factories[source] = namespace["factory"]
+    return factory
+
+def _identifier(name: str) -> str:
+    return name if name.isidentifier() and not name.startswith(PREFIX) else "compiled"
+
+def _specialize_partial(func: partial) -> Callable:
+    """Generates a function calling the wrapped function of a partial object
+    directly with its bound arguments inlined.
+
+    Falls back to the partial itself if its signature cannot be inspected.
+    """
+    try:
+        signature = inspect.signature(func)
+    except (TypeError, ValueError):
+        return func
+    if any(name.startswith(PREFIX) for name in signature.parameters):
+        return func
+
+    # partial keywords that aren't bound to a named parameter are passed through **kwargs
+    named = {
+        name for name, param in signature.parameters.items()
+        if param.kind not in (param.VAR_POSITIONAL, param.VAR_KEYWORD)
+    }
+    extra = {key: value for key, value in func.keywords.items() if key not in named}
+    var_keyword = any(param.kind is param.VAR_KEYWORD for param in signature.parameters.values())
+    if extra and not var_keyword:
+        return func
+
+    bound = [f"{PREFIX}a{i}" for i in range(len(func.args))]
+    params, args, defaults = [], list(bound), []
+    kind = None
+    for i, param in enumerate(signature.parameters.values()):
+        if kind is param.POSITIONAL_ONLY and param.kind is not kind:
+            params.append("/")
+        if param.kind is param.KEYWORD_ONLY and kind not in (param.KEYWORD_ONLY, param.VAR_POSITIONAL):
+            params.append("*")
+        kind = param.kind
+
+        name = param.name
+        if kind is param.VAR_POSITIONAL:
+            params.append(f"*{name}")
+            args.append(f"*{name}")
+        elif kind is param.VAR_KEYWORD:
+            params.append(f"**{name}")
+            # keywords given when called take precedence over the bound ones
+            args.append(f"**{{**{PREFIX}kw, **{name}}}" if extra else f"**{name}")
+        else:
+            if param.default is param.empty:
+                params.append(name)
+            else:
+                params.append(f"{name}={PREFIX}d{i}")
+                defaults.append((f"{PREFIX}d{i}", param.default))
+            args.append(f"{name}={name}" if kind is param.KEYWORD_ONLY else name)
+    if kind is inspect.Parameter.POSITIONAL_ONLY:
+        params.append("/")
+
+    name = _identifier(getattr(func, "__name__", func.func.__name__))
+    factory_args = ", ".join([f"{PREFIX}func", f"{PREFIX}kw", *bound, *(d for d, _ in defaults)])
+    source = (
+        f"def factory({factory_args}):\n"
+        f"    def {name}({', '.join(params)}):\n"
+        f"        return {PREFIX}func({', '.join(args)})\n"
+        f"    return {name}\n"
+    )
+    specialized = _factory(source, name)(func.func, extra, *func.args, *(v for _, v in defaults))
+    return _describe(specialized, func.func)
+
+def _describe(specialized: Callable, original: Callable) -> Callable:
+    for attr in ("__module__", "__name__", "__qualname__", "__doc__"):
+        try:
+            setattr(specialized, attr, getattr(original, attr))
+        except (AttributeError, TypeError):
+            pass
+    return specialized
+
+def _stage(stage: Any) -> Callable:
+    if isinstance(stage, curry):
+        func, args, kwargs = stage._unwrap()
+        return _specialize_partial(partial(func, *args, **kwargs))
+    if isinstance(stage, Function):
+        return stage.func
+    if isinstance(stage, BaseInfix):
+        return stage.function
+    if isinstance(stage, partial):
+        return _specialize_partial(stage)
+    if not callable(stage):
+        raise TypeError(f"stages must be callable, got type {type(stage)}")
+    return stage
+
+def compile(*stages: Callable) -> Callable:
+    """Specializes a pipefunc chain, curried function or infix function.
+
+    The returned function calls the wrapped functions directly, skipping the
+    validation of `Function.func`, argument binding and infix operand state.
+    Pipelines are composed in the order they would be piped, so
+    `compile(f, g, h)(x)` is equivalent to `x | f | g | h`. Curried functions
+    are compiled into a function taking exactly their remaining arguments, and
+    therefore can no longer be partially applied.
+
+    Calls made through a compiled function are not recorded by the profiler.
+    When a stage cannot be specialized it is called as is.
+
+    >>> @curry
+    >>> def add(a, b, c):
+    ...     return a + b + c
+    ...
+    >>> add3 = compile(add(1, 2))
+    >>> add3(3)
+    6
+    >>> pipeline = compile(factorial, double)
+    >>> 5 | factorial | double == pipeline(5)
+    True
+    """
+    if not stages:
+        raise TypeError("compile expected at least 1 stage, got 0")
+    funcs = [_stage(stage) for stage in stages]
+    if len(funcs) == 1:
+        return funcs[0]
+
+    names = [f"{PREFIX}s{i}" for i in range(len(funcs))]
+    call = f"{names[0]}(*args, **kwargs)"
+    for name in names[1:]:
+        call = f"{name}({call})"
+    source = (
+        f"def factory({', '.join(names)}):\n"
+        f"    def pipeline(*args, **kwargs):\n"
+        f"        return {call}\n"
+        f"    return pipeline\n"
+    )
+    return _factory(source, "pipeline")(*funcs)
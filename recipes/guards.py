@@ -1,22 +1,98 @@
 # 04/01/22
 # guards.py
 from __future__ import annotations
-from dataclasses import dataclass
+from abc import ABCMeta, get_cache_token
+from types import BuiltinFunctionType, FunctionType, MethodType, UnionType
 from typing import Any, Literal, overload, TypeVar, Callable
+from .utils import options
 
-__all__ = "BaseGuard", "Guard", "PartialGuard", "guard"
+__all__ = "BaseGuard", "Guard", "PartialGuard", "TypeGuard", "guard"
 
 T = TypeVar("T")
 
 GuardFunction = Callable[[T], bool]
 
 def valid_classinfo(classinfo: Any):
+    if isinstance(classinfo, type):
+        return True
+    # common guard functions are rejected without raising an exception
+    if isinstance(classinfo, (FunctionType, BuiltinFunctionType, MethodType)):
+        return False
     try:
         isinstance(..., classinfo)
     except TypeError:
         return False
     return True
 
+def flatten_classinfo(classinfo: Any) -> tuple[Any, ...]:
+    "Returns the classes of a type, UnionType or nested tuple of types."
+    if isinstance(classinfo, tuple):
+        return tuple(cls for info in classinfo for cls in flatten_classinfo(info))
+    if isinstance(classinfo, UnionType):
+        return flatten_classinfo(classinfo.__args__)
+    return classinfo,
+
+class TypeGuard:
+    """Guard function for a type, UnionType or tuple of types, which caches the
+    result of isinstance for each type of value checked.
+
+    Results are only cached when every class is a plain class or an abstract base
+    class, whose instance checks only depend on the type of the value. The cache
+    holds at most `maxsize` types, evicting the oldest first, and is cleared
+    whenever a class is registered to an abstract base class.
+    """
+
+    __slots__ = "__name__", "classinfo", "maxsize", "_cache", "_cacheable", "_abstract", "_token"
+
+    def __init__(self, classinfo: Any, maxsize: int=256):
+        classes = flatten_classinfo(classinfo)
+        self.__name__ = "isinstance"
+        self.classinfo = classinfo
+        self.maxsize = maxsize
+        self._cache: dict[type, bool] = {}
+        self._cacheable = all(type(cls) in (type, ABCMeta) for cls in classes)
+        self._abstract = any(type(cls) is ABCMeta for cls in classes)
+        self._token = get_cache_token()
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.classinfo!r})"
+
+    def __call__(self, value: Any) -> bool:
+        if self._abstract and self._token != get_cache_token():
+            self._cache.clear()
+            self._token = get_cache_token()
+        cls = type(value)
+        result = self._cache.get(cls)
+        if result is None:
+            result = isinstance(value, self.classinfo)
+            # values overriding __class__ may not share the result of their type
+            if self._cacheable and value.__class__ is cls:
+                if len(self._cache) >= self.maxsize:
+                    # another thread may change the cache or evict the same entry,
+                    # which must not raise
+                    try:
+                        self._cache.pop(next(iter(self._cache), None), None)
+                    except RuntimeError:
+                        self._cache.clear()
+                self._cache[cls] = result
+        return result
+
+# smallest number of plain classes for which caching is faster than isinstance
+MIN_CACHED_CLASSES = 8
+
+def classinfo_guard(classinfo: Any) -> GuardFunction:
+    """Returns the guard function for a type, UnionType or tuple of types.
+
+    A TypeGuard is only used when its cache is faster than isinstance, that is
+    when the classes include an abstract base class or there are at least
+    MIN_CACHED_CLASSES of them. Otherwise isinstance is called directly.
+    """
+    classes = flatten_classinfo(classinfo)
+    metaclasses = {type(cls) for cls in classes}
+    if metaclasses <= {type, ABCMeta} and (ABCMeta in metaclasses or len(classes) >= MIN_CACHED_CLASSES):
+        return TypeGuard(classinfo)
+    return lambda value: isinstance(value, classinfo)
+
 class BaseGuard:
     """Abstract base class for creating guards.
 
@@ -36,15 +112,18 @@ class BaseGuard:
 
     @property
     def guard(self) -> GuardFunction:
-        self.guard = self._guard # ensures self._guard wasn't changed.
+        if not options.fast:
+            self.guard = self._guard # ensures self._guard wasn't changed.
         return self._guard
 
     @guard.setter
     def guard(self, guard) -> None:
         if guard is None:
             self._guard = lambda value: True
+        elif isinstance(guard, TypeGuard):
+            self._guard = guard
         elif valid_classinfo(guard):
-            self._guard = lambda value: isinstance(value, guard)
+            self._guard = classinfo_guard(guard)
         elif callable(guard):
             self._guard = guard
         else:
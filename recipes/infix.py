@@ -3,8 +3,12 @@
 from __future__ import annotations
 import inspect
 from abc import ABC, abstractmethod
-from typing import Callable, Literal, overload, TypeVar
-from .utils import Nil
+from functools import lru_cache, partial, reduce
+from typing import Any, Callable, Iterable, Iterator, Literal, overload, TypeVar, TYPE_CHECKING
+from .utils import Nil, lookup, resolve
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
 
 __all__ = "Infix", "infix", "BaseInfix"
 
@@ -49,7 +53,11 @@ class BaseInfix(ABC):
         ...
         >>> bytes_written = 'Hello, World!' |tee| "filename.txt"
         Hello, World!
+
+    Subclasses may set `associative` to True to allow parallel reductions.
     """
+    associative = False
+
     def __init__(self, function: Callable):
         if not callable(function):
             raise TypeError(f"expected a callable, got type '{type(function)}'")
@@ -127,6 +135,74 @@ class BaseInfix(ABC):
     def __call__(self, x, y):
         return self.function(x, y)
 
+    def __reduce__(self):
+        function = self.function
+        owner = lookup(function)
+        if owner is self:
+            # decorated functions are pickled by reference to their module level name
+            return resolve, (function.__module__, function.__qualname__)
+        if isinstance(owner, BaseInfix) and owner.function is function:
+            function = owner
+        cls = type(self)
+        if lookup(cls) is cls:
+            return _restore_infix, (cls, function)
+        # classes created by new_infix cannot be found by name, so they are recreated
+        return _rebuild_infix, (cls.operator(), cls.right_operator(), function, cls.associative)
+
+    def apply_pairs(self, lefts: Iterable, rights: Iterable, /, *,
+            executor: Executor | None=None, chunksize: int=1) -> Iterator:
+        """Applies the infix function to each pair of left and right operands.
+
+        Operands are passed directly to the function without binding them to the
+        infix object. An executor may be given to spread the calls over its workers.
+
+        >>> list(divides.apply_pairs([2, 3], [4, 4]))
+        [True, False]
+        """
+        if executor is not None:
+            return executor.map(self, lefts, rights, chunksize=chunksize)
+        return map(self.function, lefts, rights)
+
+    def reduce(self, iterable: Iterable, initial: Any=Nil, /, *, right: bool=False,
+            executor: Executor | None=None, chunksize: int=256) -> Any:
+        """Folds the infix function over iterable.
+
+        The default left fold matches how a chained expression is evaluated, so
+        `f.reduce([a, b, c])` is equivalent to `a |f| b |f| c`, while `right=True`
+        folds from the right as `f(a, f(b, c))`. An initial value is placed before
+        the values in a left fold and after them in a right fold.
+
+        If an executor is given, the values are reduced in chunks of `chunksize` in
+        parallel, and the partial results are reduced the same way until one value
+        is left. This requires the infix function to be declared associative.
+
+        >>> @infixed("+", associative=True)
+        >>> def add(a, b):
+        ...     return a + b
+        ...
+        >>> add.reduce(range(10_000), executor=ProcessPoolExecutor())
+        49995000
+        """
+        values = iterable if executor is None and not right else list(iterable)
+        if initial is not Nil:
+            values = [initial, *values] if not right else [*values, initial]
+        if executor is not None:
+            if not self.associative:
+                raise TypeError(f"{self} must be associative to be reduced in parallel")
+            return self._tree_reduce(values, executor, max(chunksize, 2))
+        if right:
+            function = self.function
+            return reduce(lambda acc, value: function(value, acc), reversed(values))
+        return reduce(self.function, values)
+
+    def _tree_reduce(self, values: list, executor: Executor, chunksize: int) -> Any:
+        if not values:
+            raise TypeError("reduce() of empty iterable with no initial value")
+        while len(values) > 1:
+            chunks = [values[i:i + chunksize] for i in range(0, len(values), chunksize)]
+            values = list(executor.map(partial(_fold, self), chunks))
+        return values[0]
+
     def __repr__(self):
         name = self.function.__name__
         left = self.operator()
@@ -153,25 +229,45 @@ def operator_method(value: str) -> str:
         raise TypeError(msg)
     return method
 
-def new_infix(operator: Operator, right_operator: Operator | None=None) -> NewInfix:
+def new_infix(operator: Operator, right_operator: Operator | None=None,
+        associative: bool=False) -> NewInfix:
     return type(
         "Infix", (BaseInfix, ), {"operator": classmethod(lambda cls: operator),
-        "right_operator": classmethod(lambda cls: right_operator or operator)}
+        "right_operator": classmethod(lambda cls: right_operator or operator),
+        "associative": associative}
     )
 
+def _restore_infix(cls: type[NewInfix], function: Callable) -> NewInfix:
+    if isinstance(function, BaseInfix):
+        function = function.function
+    return cls(function)
+
+@lru_cache(maxsize=None)
+def _infix_class(operator: Operator, right_operator: Operator,
+        associative: bool) -> type[NewInfix]:
+    return new_infix(operator, right_operator, associative)
+
+def _rebuild_infix(operator: Operator, right_operator: Operator, function: Callable,
+        associative: bool=False) -> NewInfix:
+    return _restore_infix(_infix_class(operator, right_operator, associative), function)
+
+def _fold(infix: BaseInfix, values: list) -> Any:
+    return reduce(infix.function, values)
+
 @overload
 def infixed(func: Operator, /, operator: None, *,
-    right_operator: Operator | None) -> type[NewInfix]: ...
+    right_operator: Operator | None, associative: bool=False) -> type[NewInfix]: ...
 
 @overload
 def infixed(func: None, /, operator: Operator | None, *,
-    right_operator: Operator | None) -> type[NewInfix]: ...
+    right_operator: Operator | None, associative: bool=False) -> type[NewInfix]: ...
 
 @overload
 def infixed(func: Callable, /, operator: Operator | None, *,
-    right_operator: Operator | None) -> NewInfix: ...
+    right_operator: Operator | None, associative: bool=False) -> NewInfix: ...
 
-def infixed(func=None, /, operator: Operator | None=None, *, right_operator: Operator | None=None):
+def infixed(func=None, /, operator: Operator | None=None, *, right_operator: Operator | None=None,
+        associative: bool=False):
     """Helper function for dynamically creating Infixed functions without having to directly
     subclass BaseInfix.
 
@@ -208,21 +304,21 @@ def infixed(func=None, /, operator: Operator | None=None, *, right_operator: Ope
     """
     match func, operator, right_operator:
         case None, None, None:
-            return new_infix("|", "|")
+            return new_infix("|", "|", associative)
         case str(_), None, None:
-            return new_infix(func, func)
+            return new_infix(func, func, associative)
         case str(_), _, None:
-            return new_infix(func, operator)
+            return new_infix(func, operator, associative)
         case str(_), None, str(_):
-            return new_infix(func, right_operator)
+            return new_infix(func, right_operator, associative)
         case None, str(_), str(_):
-            return new_infix(operator, right_operator)
+            return new_infix(operator, right_operator, associative)
         case None, str(_), None:
-            return new_infix(operator, operator)
+            return new_infix(operator, operator, associative)
         case _, None, None:
-            return new_infix("|", "|")(func)
+            return new_infix("|", "|", associative)(func)
         case _, str(_), _:
-            return new_infix(operator, right_operator)(func)
+            return new_infix(operator, right_operator, associative)(func)
     raise ValueError(f"{type(func)}, {type(operator)}, {type(right_operator)}")
 
 Infix: NewInfix = new_infix("|")
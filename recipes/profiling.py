@@ -0,0 +1,162 @@
+# 10/19/26
+# profiling.py
+from __future__ import annotations
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+__all__ = "Profiler", "StageStats", "profiler"
+
+@dataclass
+class StageStats:
+    """Aggregated measurements for a single pipeline stage.
+
+    Times are stored in seconds.
+    """
+    name: str
+    calls: int = 0
+    errors: int = 0
+    wall: float = 0.0
+    cpu: float = 0.0
+    items_in: int = 0
+    items_out: int = 0
+
+def stage_name(func: Callable) -> str:
+    "Returns the name a stage is recorded under, for callables with or without a __name__."
+    return getattr(func, "__name__", None) or type(func).__name__
+
+def count_items(value: Any) -> int:
+    """A call carries a single item, unless the value is a list, tuple, set,
+    frozenset or dict in which case its length is counted instead."""
+    if isinstance(value, (list, tuple, set, frozenset, dict)):
+        return len(value)
+    return 1
+
+class Profiler:
+    """Records per-stage statistics and trace events for pipefunc and curry calls.
+
+    Profiling is disabled by default, in which case the only cost for a call is
+    checking the `enabled` attribute. It can be switched on and off at runtime,
+    or used as a context manager.
+
+    >>> from recipes import profiler
+    >>> with profiler:
+    ...     5 | factorial
+    ...
+    120
+    >>> profiler.stats["factorial"].calls
+    6
+    >>> profiler.export_chrome_trace("trace.json")
+    """
+
+    def __init__(self, max_events: int = 1_000_000):
+        self.enabled = False
+        self.max_events = max_events
+        self.stats: dict[str, StageStats] = {}
+        self.events: list[dict[str, Any]] = []
+        self._samples: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._previous: list[bool] = []
+
+    def __repr__(self):
+        state = "enabled" if self.enabled else "disabled"
+        return f"<{type(self).__name__} {state}, {len(self.stats)} stages>"
+
+    def __enter__(self) -> Profiler:
+        self._previous.append(self.enabled)
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.enabled = self._previous.pop()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self.stats.clear()
+            self.events.clear()
+            self._samples.clear()
+
+    def call(self, name: str, func: Callable, args: tuple, kwargs: dict) -> Any:
+        """Calls `func` as the stage `name` and records its measurements."""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        # each frame holds the stage name and the wall time spent in nested stages
+        frame = [name, 0.0]
+        stack.append(frame)
+        error = None
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            cpu = time.thread_time() - cpu_start
+            wall = time.perf_counter() - wall_start
+            path = tuple(name for name, _ in stack)
+            stack.pop()
+            if stack:
+                stack[-1][1] += wall
+            if len(args) == 1 and not kwargs:
+                items_in = count_items(args[0])
+            else:
+                items_in = 1
+            items_out = 0 if error is not None else count_items(result)
+            self._record(path, wall_start, wall, cpu, frame[1], items_in, items_out, error)
+        return result
+
+    def _record(self, path, start, wall, cpu, nested, items_in, items_out, error):
+        name = path[-1]
+        with self._lock:
+            stats = self.stats.get(name)
+            if stats is None:
+                stats = self.stats[name] = StageStats(name)
+            stats.calls += 1
+            stats.wall += wall
+            stats.cpu += cpu
+            stats.items_in += items_in
+            stats.items_out += items_out
+            if error is not None:
+                stats.errors += 1
+            self._samples[path] = self._samples.get(path, 0.0) + max(wall - nested, 0.0)
+            if len(self.events) < self.max_events:
+                event = {
+                    "name": name, "cat": "recipes", "ph": "X",
+                    "ts": start * 1e6, "dur": wall * 1e6,
+                    "pid": os.getpid(), "tid": threading.get_ident(),
+                    "args": {"items_in": items_in, "items_out": items_out},
+                }
+                if error is not None:
+                    event["args"]["error"] = type(error).__name__
+                self.events.append(event)
+
+    def export_chrome_trace(self, path: str | os.PathLike) -> None:
+        """Writes the recorded events in the Chrome trace event format, which can be
+        opened with chrome://tracing or https://ui.perfetto.dev."""
+        with self._lock:
+            trace = {"traceEvents": list(self.events), "displayTimeUnit": "ms"}
+        with open(path, "w") as file:
+            json.dump(trace, file)
+
+    def export_flamegraph(self, path: str | os.PathLike) -> None:
+        """Writes the recorded self times, in microseconds, in the collapsed stack
+        format used by flamegraph.pl, inferno and speedscope."""
+        with self._lock:
+            samples = sorted(self._samples.items())
+        with open(path, "w") as file:
+            for stack, seconds in samples:
+                file.write(f"{';'.join(stack)} {round(seconds * 1e6)}\n")
+
+profiler = Profiler()
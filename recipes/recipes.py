@@ -1,8 +1,15 @@
 # 04/02/22
 # recipes.py
+from __future__ import annotations
 import  inspect
 from functools import wraps, partial
-from typing import Any, Callable
+from itertools import starmap
+from typing import Any, Callable, Iterable, Iterator, TYPE_CHECKING
+from .profiling import profiler, stage_name
+from .utils import lookup, options, resolve
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
 
 __all__ = "pipefunc", "curry"
 
@@ -22,8 +29,26 @@ class Function:
         return f"<{name} function {func} at {id(self):#x}>"
 
     def __call__(self, *arg, **kwargs) -> Any:
+        if profiler.enabled:
+            return profiler.call(stage_name(self.func), self.func, arg, kwargs)
         return self.func(*arg, **kwargs)
 
+    def __reduce__(self):
+        func, args, kwargs = self._unwrap()
+        owner = lookup(func)
+        if owner is self:
+            # decorated functions are pickled by reference to their module level name
+            return resolve, (func.__module__, func.__qualname__)
+        if isinstance(owner, Function) and owner._unwrap()[0] is func:
+            # the module level name is bound to the decorated function, which is
+            # pickled in its place and unwrapped again by _restore_owned
+            return _restore_owned, (type(self), owner, args, kwargs)
+        return _restore, (type(self), func, args, kwargs)
+
+    def _unwrap(self) -> tuple[Callable, tuple, dict]:
+        "Returns the wrapped function with its bound positional and keyword arguments."
+        return self._func, (), {}
+
     @staticmethod
     def _require_callable(func: Callable) -> None:
         if not callable(func):
@@ -31,6 +56,8 @@ class Function:
 
     @property
     def func(self) -> Callable:
+        if options.fast:
+            return self._func
         if not hasattr(self, "_func"):
             raise AttributeError("function has not been set")
         self._require_callable(self._func)
@@ -80,6 +107,15 @@ class curry(Function):
         self._signature = inspect.signature(self.func)
         self.func.__name__ = func.__name__
 
+    def _unwrap(self) -> tuple[Callable, tuple, dict]:
+        # partials with a __dict__ are not flattened when nested, so they are walked instead
+        func, args, kwargs = self._func, (), {}
+        while isinstance(func, partial):
+            args = func.args + args
+            kwargs = {**func.keywords, **kwargs}
+            func = func.func
+        return func, args, kwargs
+
     def __call__(self, *args, **kwargs):
         try:
             bound = self._signature.bind(*args, **kwargs)
@@ -93,4 +129,71 @@ class curry(Function):
             else:
                 return type(self)(self.func, *args, **kwargs)
         else:
+            if profiler.enabled:
+                return profiler.call(stage_name(self.func), self.func, args, kwargs)
             return self.func(*args, **kwargs)
+
+    def map(self, iterable: Iterable, /, *, executor: Executor | None=None,
+            chunksize: int=1) -> Iterator:
+        """Applies the curried function to each item of iterable.
+
+        The bound arguments are resolved once rather than for every item, so each
+        item must complete the call; items that don't raise a TypeError instead of
+        returning a curried function. An executor such as a ThreadPoolExecutor or
+        ProcessPoolExecutor may be given to spread the calls over its workers, in
+        which case chunksize is forwarded to Executor.map.
+
+        >>> list(add(5, 15).map(range(3)))
+        [20, 21, 22]
+        """
+        if executor is not None:
+            return executor.map(_Resolved(self), iterable, chunksize=chunksize)
+        return map(self._resolve(), iterable)
+
+    def starmap(self, iterable: Iterable[Iterable], /, *, executor: Executor | None=None,
+            chunksize: int=1) -> Iterator:
+        """Like curry.map, but each item of iterable is unpacked into the arguments.
+
+        >>> list(add(5).starmap([(1, 2), (3, 4)]))
+        [8, 12]
+        """
+        if executor is not None:
+            return executor.map(_Resolved(self).star, iterable, chunksize=chunksize)
+        return starmap(self._resolve(), iterable)
+
+    def _resolve(self) -> Callable:
+        "Returns a function calling the wrapped function directly with the bound arguments."
+        func, args, kwargs = self._unwrap()
+        func = partial(func, *args, **kwargs)
+        if profiler.enabled:
+            name = stage_name(self.func)
+            return lambda *args: profiler.call(name, func, args, {})
+        return func
+
+
+class _Resolved:
+    """A curried function with its bound arguments resolved once.
+
+    It is pickled through the curried function and resolved again when unpickled,
+    so process pools resolve it once per submitted chunk rather than per item.
+    """
+    __slots__ = "curried", "func"
+
+    def __init__(self, curried: curry):
+        self.curried = curried
+        self.func = curried._resolve()
+
+    def __reduce__(self):
+        return _Resolved, (self.curried,)
+
+    def __call__(self, *args: Any) -> Any:
+        return self.func(*args)
+
+    def star(self, args: Iterable) -> Any:
+        return self.func(*args)
+
+def _restore(cls: type[Function], func: Callable, args: tuple, kwargs: dict) -> Function:
+    return cls(func, *args, **kwargs)
+
+def _restore_owned(cls: type[Function], owner: Function, args: tuple, kwargs: dict) -> Function:
+    return cls(owner._unwrap()[0], *args, **kwargs)
@@ -0,0 +1,217 @@
+# 10/19/26
+# records.py
+from __future__ import annotations
+import json
+import mmap
+import os
+import struct
+from collections.abc import Sequence
+from typing import Any, Iterable, overload
+from .tuples import TupleFactory, tuple_class
+
+__all__ = "RecordFile", "read_records", "write_records"
+
+MAGIC = b"RTUP"
+VERSION = 1
+# magic, version and header length
+PREAMBLE = struct.Struct("<4sHI")
+
+# struct formats used for field values when not given explicitly
+DEFAULT_FORMATS = {"bool": "?", "int": "q", "float": "d"}
+
+def _kind(value: Any) -> str:
+    for kind in (bool, int, float, str, bytes):
+        if isinstance(value, kind):
+            return kind.__name__
+    raise TypeError(f"unsupported field type {type(value)}, expected bool, int, float, str or bytes")
+
+def _schema(record: TupleFactory, formats: dict[int | str, str]) -> dict[str, Any]:
+    if not record._fields:
+        raise ValueError("records must have at least one field")
+    kinds, codes = [], []
+    for field, value in zip(record._fields, record):
+        kind = _kind(value)
+        code = formats.get(field) or DEFAULT_FORMATS.get(kind)
+        if code is None:
+            raise TypeError(f"a fixed width format such as '16s' must be given for {kind} field {field!r}")
+        kinds.append(kind)
+        codes.append(code)
+    return {
+        "size": record._size, "names": list(record._fields[record._size:]),
+        "kinds": kinds, "formats": codes,
+    }
+
+def _check_kinds(record: TupleFactory, kinds: list[str], count: int) -> None:
+    for field, value, kind in zip(record._fields, record, kinds):
+        try:
+            actual = _kind(value)
+        except TypeError as err:
+            raise ValueError(f"record {count} field {field!r}: {err}") from None
+        # int values are widened in float fields, but bool is kept distinct from int
+        if actual != kind and not (kind == "float" and actual == "int"):
+            raise ValueError(f"record {count} field {field!r} is {actual}, expected {kind}")
+
+def _encoder(schema: dict[str, Any]):
+    lengths = [
+        (i, struct.calcsize(code))
+        for i, (kind, code) in enumerate(zip(schema["kinds"], schema["formats"]))
+        if kind in ("str", "bytes")
+    ]
+    if not lengths:
+        return None
+
+    def encode(values):
+        values = list(values)
+        for i, length in lengths:
+            value = values[i]
+            if isinstance(value, str):
+                value = values[i] = value.encode()
+            if len(value) > length:
+                raise ValueError(f"field value {value!r} is longer than {length} bytes")
+        return values
+    return encode
+
+def _create_temporary(path: str | os.PathLike) -> tuple[int, str]:
+    """Creates a new file next to path, returning its descriptor and name.
+
+    Unlike tempfile.mkstemp, the file gets the permissions of a file created by
+    open, that is 0o666 less the process umask.
+    """
+    base = os.path.abspath(path)
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+    while True:
+        temporary = f"{base}.{os.urandom(4).hex()}.tmp"
+        try:
+            return os.open(temporary, flags, 0o666), temporary
+        except FileExistsError:
+            continue
+
+def write_records(path: str | os.PathLike, records: Iterable[TupleFactory],
+        formats: dict[int | str, str] | None=None) -> int:
+    """Writes records sharing the same fields to a fixed schema binary file.
+
+    The schema is taken from the fields of the first record and the types of its
+    values: bool, int and float fields are stored as '?', 'q' and 'd' struct
+    formats unless another format is given in `formats`, which is required for
+    str and bytes fields, such as {"name": "16s"}. Every record must have values
+    of the same types as the first one, except that int values are accepted and
+    read back as float in float fields. str and bytes values are padded with null
+    bytes, which are stripped when read back. Returns the number of records
+    written.
+
+    >>> write_records("points.rec", (Tuple(x=i, y=i * 2.0) for i in range(3)))
+    3
+    >>> read_records("points.rec")[1]
+    (x=1, y=2.0)
+    """
+    formats = formats or {}
+    count = 0
+    # records are written to a temporary file which replaces path once complete,
+    # so that a failed write never destroys an existing file
+    descriptor, temporary = _create_temporary(path)
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            for record in records:
+                if count == 0:
+                    fields = record._fields
+                    schema = _schema(record, formats)
+                    packer = struct.Struct("<" + "".join(schema["formats"]))
+                    encode = _encoder(schema)
+                    header = json.dumps(schema).encode()
+                    # records start at an 8 byte boundary
+                    header += b" " * (-(PREAMBLE.size + len(header)) % 8)
+                    file.write(PREAMBLE.pack(MAGIC, VERSION, len(header)) + header)
+                elif record._fields != fields:
+                    raise ValueError(f"record {count} has fields {record._fields}, expected {fields}")
+                else:
+                    _check_kinds(record, schema["kinds"], count)
+                try:
+                    file.write(packer.pack(*(encode(record) if encode else record)))
+                except struct.error as err:
+                    raise ValueError(f"record {count} does not match the schema: {err}") from None
+                count += 1
+        if count == 0:
+            raise ValueError("cannot infer a schema without any records")
+        os.replace(temporary, path)
+    except BaseException:
+        os.remove(temporary)
+        raise
+    return count
+
+class RecordFile(Sequence):
+    """A lazy sequence of the records in a file written by write_records.
+
+    The file is memory mapped, and only the records that are accessed by
+    indexing or slicing are decoded.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        with open(path, "rb") as file:
+            # also rejects empty files, which can't be memory mapped
+            if os.fstat(file.fileno()).st_size < PREAMBLE.size:
+                raise ValueError(f"{path} is not a version {VERSION} record file")
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, length = PREAMBLE.unpack_from(self._mmap)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a version {VERSION} record file")
+            schema = json.loads(self._mmap[PREAMBLE.size:PREAMBLE.size + length])
+        except ValueError:
+            self._mmap.close()
+            raise
+        self.path = path
+        self._offset = PREAMBLE.size + length
+        self._struct = struct.Struct("<" + "".join(schema["formats"]))
+        self._class = tuple_class(schema["size"], tuple(schema["names"]))
+        self._decoded = [(i, kind) for i, kind in enumerate(schema["kinds"]) if kind in ("str", "bytes")]
+        self._length, remainder = divmod(len(self._mmap) - self._offset, self._struct.size)
+        if remainder:
+            self._mmap.close()
+            raise ValueError(f"{path} is truncated")
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.path!r}, {self._length} records>"
+
+    def __enter__(self) -> RecordFile:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    @property
+    def fields(self) -> tuple[int | str, ...]:
+        return self._class._fields
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> TupleFactory: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[TupleFactory]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._decode(i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("record index out of range")
+        return self._decode(index)
+
+    def _decode(self, index: int) -> TupleFactory:
+        values = self._struct.unpack_from(self._mmap, self._offset + index * self._struct.size)
+        if self._decoded:
+            values = list(values)
+            for i, kind in self._decoded:
+                value = values[i].rstrip(b"\0")
+                values[i] = value.decode() if kind == "str" else value
+        return self._class._make(values)
+
+def read_records(path: str | os.PathLike) -> RecordFile:
+    "Opens a file written by write_records as a lazy sequence of records."
+    return RecordFile(path)
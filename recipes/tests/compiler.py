@@ -0,0 +1,117 @@
+# 10/19/26
+# tests/compiler.py
+from functools import partial
+import pytest
+from .. import pipefunc, curry, infixed, compile
+
+@pytest.fixture
+def stages():
+    @pipefunc
+    def factorial(n, a=1):
+        if n <= 0:
+            return a
+        return factorial(n - 1, n * a)
+
+    @pipefunc
+    def double(x):
+        return x * 2
+
+    @pipefunc
+    def digits(x):
+        return [int(d) for d in str(x)]
+
+    return factorial, double, digits
+
+def test_compile_pipeline(stages):
+    factorial, double, digits = stages
+    pipeline = compile(factorial, double, digits)
+    for n in range(10):
+        assert pipeline(n) == n | factorial | double | digits
+    assert pipeline(3, a=2) == digits(double(factorial(3, a=2)))
+
+def test_compile_single_stage(stages):
+    factorial, *_ = stages
+    compiled = compile(factorial)
+    assert compiled is factorial.func
+    assert compiled(5) == 5 | factorial
+
+def test_compile_curry():
+    @curry
+    def add(a, b, c, d=0):
+        return a + b + c + d
+
+    add3 = compile(add(1, 2))
+    assert add3.__name__ == "add"
+    for c in range(-5, 5):
+        assert add3(c) == add(1, 2)(c) == add(1, 2, c)
+        assert add3(c, 10) == add(1, 2)(c, 10)
+        assert add3(c=c, d=1) == add(1, 2)(c=c, d=1)
+    with pytest.raises(TypeError):
+        add3()
+
+@pytest.mark.parametrize("args, kwargs, call_args, call_kwargs", [
+    ((1,), {}, (2,), {"c": 3}),
+    ((), {"b": 2}, (1,), {"c": 3}),
+    ((1, 2), {}, (3, 4, 5), {"x": 6}),
+    ((1,), {"x": 6}, (2,), {}),
+    ((1,), {"x": 6}, (2,), {"x": 7, "y": 8}),
+])
+def test_compile_curry_signatures(args, kwargs, call_args, call_kwargs):
+    def func(a, /, b, *rest, c=0, **extra):
+        return a, b, rest, c, extra
+
+    curried = curry(func, *args, **kwargs)
+    compiled = compile(curried)
+    assert compiled(*call_args, **call_kwargs) == curried(*call_args, **call_kwargs)
+
+def test_compile_curry_var_keywords():
+    def func(a, b, **extra):
+        return a, b, extra
+
+    assert compile(curry(func, x=6))(1, 2) == (1, 2, {"x": 6})
+
+    def pos_only(a, /, **kw):
+        return a, kw
+
+    curried = curry(pos_only, 1, a=2)
+    assert compile(curried)() == curried() == (1, {"a": 2})
+    assert compile(curried)(a=3) == (1, {"a": 3})
+
+def test_compile_curry_in_pipeline(stages):
+    _, double, _ = stages
+
+    @curry
+    def add(a, b):
+        return a + b
+
+    pipeline = compile(double, add(10))
+    assert pipeline(5) == add(10)(double(5)) == 20
+
+def test_compile_infix():
+    @infixed
+    def divides(a, b):
+        return b % a == 0
+
+    compiled = compile(divides)
+    for a, b in ((3, 9), (2, 9), (5, 100)):
+        assert compiled(a, b) == a |divides| b
+
+def test_compile_fallback():
+    # builtins without an inspectable signature are called through the partial
+    compiled = compile(partial(max, 3))
+    assert isinstance(compiled, partial)
+    assert compiled(5) == 5
+
+    pipeline = compile(abs, str)
+    assert pipeline(-3) == "3"
+
+    with pytest.raises(TypeError):
+        compile()
+    with pytest.raises(TypeError):
+        compile(1)
+
+def test_compile_cache():
+    first = compile(curry(lambda a, b: a - b, 1))
+    second = compile(curry(lambda a, b: a * b, 2))
+    assert first.__code__ is second.__code__
+    assert first(3) == -2 and second(3) == 6
@@ -1,7 +1,7 @@
 # 03/11/22
 # tests.py
 import pytest
-from .. import BaseGuard, Guard, PartialGuard, guard
+from .. import BaseGuard, Guard, PartialGuard, TypeGuard, guard
 
 @pytest.fixture
 def is_even():
@@ -71,3 +71,71 @@ def test_guard_helper_function(guard_helper, is_even, list_of_types):
     assert guard_helper(0 | even_partial, initial=0, invalid=1, new=2)
     assert guard_helper(guard([], list_of_types), initial=[], invalid=..., new=())
     assert guard_helper(guard([], list_of_types), initial=[], invalid=..., new=None)
+
+def test_TypeGuard_cache(list_of_types):
+    guarded = Guard([], list_of_types)
+    check = guarded.guard
+    assert isinstance(check, TypeGuard)
+    assert guarded.guard is check
+    assert check([]) and check(None) and not check(...)
+    assert check._cache == {list: True, type(None): True, type(...): False}
+
+    partial = PartialGuard(int)
+    assert (1 | partial).guard is partial.guard
+
+def test_TypeGuard_selection():
+    from collections.abc import Mapping
+    from typing import Protocol, runtime_checkable
+
+    @runtime_checkable
+    class Named(Protocol):
+        name: str
+
+    # few plain classes are checked by isinstance directly, which is faster
+    for classinfo in (int, int | str, (int, float, complex, str, bytes), (int, Named)):
+        check = Guard(0, classinfo).guard
+        assert not isinstance(check, TypeGuard) and check(0) and not check(...)
+    assert isinstance(Guard({}, Mapping).guard, TypeGuard)
+    assert isinstance(Guard(0, int | Mapping).guard, TypeGuard)
+
+def test_TypeGuard_maxsize():
+    check = TypeGuard((int, str), maxsize=2)
+    assert check(1) and check("") and not check(1.0)
+    assert list(check._cache) == [str, float]
+
+def test_TypeGuard_abc_register():
+    from abc import ABC
+
+    class Base(ABC):
+        pass
+
+    class Value:
+        pass
+
+    check = TypeGuard(int | Base)
+    assert not check(Value())
+    Base.register(Value)
+    assert check(Value())
+
+def test_TypeGuard_uncached():
+    from typing import Protocol, runtime_checkable
+
+    @runtime_checkable
+    class Named(Protocol):
+        name: str
+
+    class Value:
+        pass
+
+    check = TypeGuard((int, Named))
+    named, unnamed = Value(), Value()
+    named.name = "value"
+    assert check(named) and not check(unnamed)
+    assert check._cache == {}
+
+    class Proxy:
+        __class__ = int
+
+    check = TypeGuard(int)
+    assert check(Proxy())
+    assert check._cache == {}
@@ -116,3 +116,89 @@ def test_infix():
 
     cartesian_product = lambda A, B: ((a, b) for a in A for b in B)
     prod = infixed(cartesian_product, "*")
+
+@infixed
+def divides(a, b):
+    return b % a == 0
+
+def concat(a, b):
+    return f"{a}{b}"
+
+def apply(infix, a, b):
+    return infix(a, b)
+
+def test_pickle_round_trip():
+    import pickle
+    assert pickle.loads(pickle.dumps(divides)) is divides
+
+    plus = infixed(concat, "+")
+    restored = pickle.loads(pickle.dumps(plus))
+    assert restored is not plus
+    assert type(restored).operator() == type(restored).right_operator() == "+"
+    assert 1 +restored+ 2 == "12"
+    assert type(pickle.loads(pickle.dumps(plus))) is type(restored)
+
+    # bound operands are not carried over
+    plus.left_bind = 1
+    assert pickle.loads(pickle.dumps(plus)).left_bind is Nil
+
+def test_process_pool():
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    mixed = infixed(concat, "<<", right_operator=">>")
+    with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("spawn")) as pool:
+        assert pool.submit(apply, divides, 3, 9).result() is True
+        assert pool.submit(apply, mixed, "a", "b").result() == "ab"
+        returned = pool.submit(pickle_identity, mixed).result()
+    assert "a" <<returned>> "b" == "ab"
+
+def pickle_identity(value):
+    return value
+
+@infixed("+", associative=True)
+def add(a, b):
+    return a + b
+
+def test_apply_pairs():
+    assert list(divides.apply_pairs([2, 3, 5], [4, 4, 10])) == [True, False, True]
+    assert divides.left_bind is Nil and divides.right_bind is Nil
+    assert list(add.apply_pairs([], [])) == []
+
+def test_reduce():
+    @infixed
+    def sub(a, b):
+        return a - b
+
+    assert sub.reduce([10, 2, 3]) == 10 |sub| 2 |sub| 3 == 5
+    assert sub.reduce([10, 2, 3], right=True) == 10 - (2 - 3) == 11
+    assert sub.reduce([2, 3], 10) == 5
+    assert sub.reduce([10, 2], 3, right=True) == 10 - (2 - 3)
+    assert sub.reduce(iter([1])) == 1
+    with pytest.raises(TypeError):
+        sub.reduce([])
+    assert sub.left_bind is Nil and sub.right_bind is Nil
+
+def test_associative():
+    assert add.associative and type(add).associative
+    assert not divides.associative
+    assert not new_infix("|").associative
+    assert infixed("*", associative=True).associative
+
+def test_parallel_reduce():
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+    with ThreadPoolExecutor(2) as pool:
+        assert add.reduce(range(1000), executor=pool, chunksize=7) == sum(range(1000))
+        assert add.reduce([], 5, executor=pool) == 5
+        with pytest.raises(TypeError):
+            add.reduce([], executor=pool)
+        with pytest.raises(TypeError):
+            divides.reduce([1, 2], executor=pool)
+        assert list(add.apply_pairs(range(3), range(3), executor=pool)) == [0, 2, 4]
+
+    words = [str(i) for i in range(100)]
+    with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("spawn")) as pool:
+        assert add.reduce(range(10_000), executor=pool, chunksize=100) == sum(range(10_000))
+        assert add.reduce(words, "", executor=pool, chunksize=3) == "".join(words)
+        restored = pool.submit(pickle_identity, infixed(concat, "*", associative=True)).result()
+    assert restored.associative
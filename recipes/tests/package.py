@@ -0,0 +1,55 @@
+# 10/19/26
+# tests/package.py
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+import recipes
+
+ROOT = Path(recipes.__file__).parents[1]
+
+def imported_modules(statement):
+    "Returns the modules imported by statement, measured with -X importtime."
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, check=True, cwd=ROOT,
+    )
+    modules = set()
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            name = line.rsplit("|", 1)[1].strip()
+            if name != "imported package":
+                modules.add(name)
+    return modules
+
+@pytest.fixture(scope="module")
+def startup_modules():
+    return imported_modules("pass")
+
+def test_lazy_tuple_import(startup_modules):
+    modules = imported_modules("from recipes import Tuple") - startup_modules
+    assert "recipes.tuples" in modules
+    for heavy in ("recipes.infix", "recipes.recipes", "recipes.guards",
+            "inspect", "abc", "typing", "dataclasses"):
+        assert heavy not in modules, f"{heavy} imported by 'from recipes import Tuple'"
+
+def test_lazy_guard_import(startup_modules):
+    modules = imported_modules("from recipes import guard") - startup_modules
+    assert "recipes.guards" in modules
+    assert "recipes.infix" not in modules and "inspect" not in modules
+
+def test_exports():
+    for name in recipes.__all__:
+        assert getattr(recipes, name) is not None
+    assert set(recipes.__all__) <= set(dir(recipes))
+    from recipes.compiler import compile
+    assert recipes.compile is compile
+    with pytest.raises(AttributeError):
+        recipes.missing
+
+def test_star_import():
+    namespace = {}
+    exec("from recipes import *", namespace)
+    assert {"Tuple", "curry", "pipefunc", "infixed", "guard", "Nil"} <= set(namespace)
+    # the builtin compile isn't shadowed
+    assert "compile" not in namespace
@@ -0,0 +1,111 @@
+# 10/19/26
+# tests/profiling.py
+import json
+import pytest
+from .. import pipefunc, curry, Profiler, profiler
+
+@pytest.fixture
+def stages():
+    @pipefunc
+    def double(xs):
+        return [x * 2 for x in xs]
+
+    @pipefunc
+    def total(xs):
+        return sum(xs)
+
+    @pipefunc
+    def fail(_):
+        raise ValueError("stage failed")
+
+    return double, total, fail
+
+@pytest.fixture
+def fresh_profiler():
+    profiler.reset()
+    yield profiler
+    profiler.disable()
+    profiler.reset()
+
+def test_disabled_by_default(stages, fresh_profiler):
+    double, total, _ = stages
+    assert not fresh_profiler.enabled
+    assert [1, 2] | double | total == 6
+    assert fresh_profiler.stats == {}
+    assert fresh_profiler.events == []
+
+def test_stage_stats(stages, fresh_profiler):
+    double, total, fail = stages
+    with fresh_profiler:
+        assert [1, 2, 3] | double | total == 12
+        with pytest.raises(ValueError):
+            1 | fail
+    assert not fresh_profiler.enabled
+
+    stats = fresh_profiler.stats
+    assert stats["double"].calls == 1
+    assert stats["double"].items_in == stats["double"].items_out == 3
+    assert stats["total"].items_in == 3 and stats["total"].items_out == 1
+    assert stats["fail"].errors == 1 and stats["fail"].items_out == 0
+    assert all(s.wall >= 0 and s.cpu >= 0 for s in stats.values())
+
+def test_curry_saturated_calls(fresh_profiler):
+    @curry
+    def add(a, b, c):
+        return a + b + c
+
+    fresh_profiler.enable()
+    assert add(1)(2)(3) == 6
+    fresh_profiler.disable()
+    assert fresh_profiler.stats["add"].calls == 1
+
+def test_nested_stages(fresh_profiler, tmp_path):
+    @pipefunc
+    def factorial(n, a=1):
+        if n <= 0:
+            return a
+        return factorial(n - 1, n * a)
+
+    with fresh_profiler:
+        assert 5 | factorial == 120
+    assert fresh_profiler.stats["factorial"].calls == 6
+
+    flamegraph = tmp_path / "stacks.txt"
+    fresh_profiler.export_flamegraph(flamegraph)
+    lines = flamegraph.read_text().splitlines()
+    assert len(lines) == 6
+    assert lines[-1].startswith(";".join(["factorial"] * 6) + " ")
+
+    trace = tmp_path / "trace.json"
+    fresh_profiler.export_chrome_trace(trace)
+    events = json.loads(trace.read_text())["traceEvents"]
+    assert len(events) == 6
+    assert all(event["ph"] == "X" and event["name"] == "factorial" for event in events)
+
+def test_max_events():
+    local = Profiler(max_events=2)
+
+    @pipefunc
+    def inc(x):
+        return x + 1
+
+    with local:
+        for i in range(5):
+            local.call("inc", inc.func, (i,), {})
+    assert local.stats["inc"].calls == 5
+    assert len(local.events) == 2
+
+def test_unnamed_stages(fresh_profiler):
+    from functools import partial
+
+    class Scale:
+        def __call__(self, x):
+            return x * 10
+
+    power = pipefunc(partial(pow, 2))
+    scale = pipefunc(Scale())
+    assert 3 | power | scale == 80
+    with fresh_profiler:
+        assert 3 | power | scale == 80
+    assert fresh_profiler.stats["partial"].calls == 1
+    assert fresh_profiler.stats["Scale"].calls == 1
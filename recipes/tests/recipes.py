@@ -133,3 +133,83 @@ def test_keyword_only(curry_helper, generic_message):
     add3 = add1(b=2)
     assert curry_helper(add3)
     assert add3(c=3) == 6
+
+@pipefunc
+def square(x):
+    return x * x
+
+@curry
+def volume(x, y, z):
+    return x * y * z
+
+def call(func, *args, **kwargs):
+    return func(*args, **kwargs)
+
+@pytest.fixture(scope="module")
+def process_pool():
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("spawn")) as pool:
+        yield pool
+
+def test_pickle_round_trip():
+    import pickle
+    assert pickle.loads(pickle.dumps(square)) is square
+    assert pickle.loads(pickle.dumps(volume)) is volume
+
+    partial_volume = pickle.loads(pickle.dumps(volume(2, z=3)))
+    assert isinstance(partial_volume, curry)
+    assert partial_volume(4) == 24
+    assert curry_repr_match(partial_volume)
+
+    piped = pickle.loads(pickle.dumps(pipefunc(abs)))
+    assert isinstance(piped, pipefunc) and -3 | piped == 3
+
+    # a pipefunc wrapping a curried function keeps its bound arguments
+    piped_volume = pickle.loads(pickle.dumps(pipefunc(volume(2, 3))))
+    assert isinstance(piped_volume, pipefunc) and 4 | piped_volume == 24
+
+    with pytest.raises((pickle.PicklingError, AttributeError)):
+        pickle.dumps(curry(lambda a, b: a + b))
+
+def curry_repr_match(func):
+    return re.match(r"<curried function volume at 0x[a-f0-9]+>", repr(func))
+
+def test_process_pool(process_pool):
+    assert process_pool.submit(call, square, 5).result() == 25
+    assert process_pool.submit(call, volume(2), 3, 4).result() == 24
+    assert process_pool.submit(call, volume(2, 3), z=4).result() == 24
+    assert list(process_pool.map(square, range(5))) == [0, 1, 4, 9, 16]
+    assert list(process_pool.map(volume(1, 2), range(3))) == [0, 2, 4]
+
+def test_curry_map():
+    @curry
+    def add(a, b, c):
+        return a + b + c
+
+    assert list(add(1, 2).map(range(4))) == [3, 4, 5, 6]
+    assert list(add(1)(2).map([])) == []
+    assert list(add(1).starmap([(2, 3), (4, 5)])) == [6, 10]
+    assert list(add.starmap([(1, 2, 3)])) == [6]
+    with pytest.raises(TypeError):
+        list(add(1).map(range(3)))
+
+def test_curry_map_executor(process_pool):
+    from concurrent.futures import ThreadPoolExecutor
+    expected = [volume(2, 3, z) for z in range(10)]
+    with ThreadPoolExecutor(2) as pool:
+        assert list(volume(2, 3).map(range(10), executor=pool)) == expected
+    assert list(volume(2, 3).map(range(10), executor=process_pool, chunksize=4)) == expected
+    pairs = [(y, z) for y in range(3) for z in range(3)]
+    assert list(volume(2).starmap(pairs, executor=process_pool, chunksize=3)) == \
+        [volume(2, y, z) for y, z in pairs]
+
+def test_curry_map_resolves_once(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+    calls = []
+    resolve = curry._resolve
+    monkeypatch.setattr(curry, "_resolve", lambda self: calls.append(self) or resolve(self))
+    with ThreadPoolExecutor(2) as pool:
+        assert list(volume(2, 3).map(range(50), executor=pool)) == [6 * z for z in range(50)]
+        assert list(volume(2).starmap([(1, 2)] * 50, executor=pool)) == [4] * 50
+    assert len(calls) == 2
@@ -0,0 +1,92 @@
+# 10/19/26
+# tests/records.py
+import pytest
+from .. import Tuple, RecordFile, read_records, write_records
+
+@pytest.fixture
+def records():
+    return [Tuple(i, x=i * 1.5, ok=i % 2 == 0, name=f"n{i}") for i in range(100)]
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "records.rec"
+
+def test_round_trip(records, path):
+    assert write_records(path, iter(records), {"name": "8s"}) == 100
+    with read_records(path) as dataset:
+        assert isinstance(dataset, RecordFile)
+        assert len(dataset) == 100
+        assert dataset.fields == records[0]._fields
+        assert list(dataset) == records
+        assert dataset[3] == records[3] and repr(dataset[3]) == repr(records[3])
+        assert dataset[-1] == records[-1]
+        assert dataset[10:20:3] == records[10:20:3]
+        assert dataset[3].name == "n3" and dataset[3].ok is False
+        with pytest.raises(IndexError):
+            dataset[100]
+
+def test_bytes_and_formats(path):
+    records = [Tuple(data=b"\x01\x02", small=7)]
+    write_records(path, records, {"data": "4s", "small": "b"})
+    with read_records(path) as dataset:
+        assert dataset[0] == records[0]
+    assert path.stat().st_size % 8 == 5
+
+def test_invalid_records(records, path):
+    with pytest.raises(TypeError):
+        write_records(path, records)
+    with pytest.raises(ValueError):
+        write_records(path, [Tuple(x=1), Tuple(y=1)])
+    with pytest.raises(ValueError):
+        write_records(path, [Tuple(x=1), Tuple(x="a")])
+    with pytest.raises(ValueError):
+        write_records(path, [Tuple(s="too long")], {"s": "2s"})
+    with pytest.raises(ValueError):
+        write_records(path, [])
+    with pytest.raises(ValueError):
+        write_records(path, [Tuple(x=1, f=1.5, b=True), Tuple(x=True, f=2, b=5)])
+    with pytest.raises(ValueError):
+        write_records(path, [Tuple(s="a"), Tuple(s=b"a")], {"s": "2s"})
+    with pytest.raises(ValueError):
+        write_records(path, [Tuple(x=1), Tuple(x=None)])
+    with pytest.raises(ValueError):
+        write_records(path, [Tuple(), Tuple()])
+    assert not path.exists()
+    assert list(path.parent.iterdir()) == []
+
+def test_int_widened_to_float(path):
+    write_records(path, [Tuple(f=1.5), Tuple(f=2)])
+    with read_records(path) as dataset:
+        assert dataset[1].f == 2.0 and isinstance(dataset[1].f, float)
+
+def test_failed_rewrite_keeps_file(records, path):
+    write_records(path, records, {"name": "8s"})
+    contents = path.read_bytes()
+    with pytest.raises(ValueError):
+        write_records(path, [records[0], Tuple(y=1)], {"name": "8s"})
+    assert path.read_bytes() == contents
+    assert list(path.parent.iterdir()) == [path]
+
+def test_file_permissions(records, path):
+    # written files get the same permissions as ones created by open
+    reference = path.parent / "reference"
+    reference.touch()
+    write_records(path, records, {"name": "8s"})
+    assert path.stat().st_mode == reference.stat().st_mode
+
+def test_invalid_file(records, path):
+    path.write_bytes(b"not a record file")
+    with pytest.raises(ValueError):
+        read_records(path)
+
+    # empty or shorter than the preamble
+    for contents in (b"", b"RTUP"):
+        path.write_bytes(contents)
+        with pytest.raises(ValueError, match="not a version 1 record file"):
+            read_records(path)
+
+    write_records(path, records, {"name": "8s"})
+    with open(path, "ab") as file:
+        file.write(b"\0")
+    with pytest.raises(ValueError):
+        read_records(path)
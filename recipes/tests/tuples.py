@@ -13,6 +13,9 @@ def test_multiple_instances(point):
     assert repr(point1) == "(x=1, y=2)", f"'{point1!r}' == '{point1}' and != '(x=1, y=2)'"
     assert tuple(point) != tuple(point1)
 
+def test_repr_braces():
+    assert repr(Tuple(**{"a}": 1, "{b}": 2})) == "(a}=1, {b}=2)"
+
 def test_fields(point):
     assert point._fields == fields(point) == (0, "a", "b")
 
@@ -55,3 +58,40 @@ def test_match_case_tests(point):
         case (_, _, 3): ...
         case _:
             assert False, msg(f"(_, _, 3)")
+
+def test_shared_shape(point):
+    other = Tuple(4, a=5, b=6)
+    assert type(other) is type(point)
+    assert type(Tuple(4, b=5, a=6)) is not type(point)
+    assert not hasattr(point, "__dict__")
+    assert point._unnamed == (1,) and point._named == (("a", 2), ("b", 3))
+
+def test_immutable(point):
+    with pytest.raises(TypeError):
+        point.a = 10
+    with pytest.raises(AttributeError):
+        point.c = 10
+    with pytest.raises(AttributeError):
+        Tuple(_a=1)
+
+def test_hash(point):
+    assert hash(point) == hash(Tuple(1, a=2, b=3))
+    assert {point: None, Tuple(1, a=2, b=3): None} == {point: None}
+
+def test_pickle(point):
+    import pickle
+    restored = pickle.loads(pickle.dumps(point))
+    assert restored == point and restored._fields == point._fields
+    assert type(restored) is type(point)
+
+def test_memory_report():
+    from collections import namedtuple
+    from ..tuples import memory_report
+    Point = namedtuple("Point", "x y z")
+    Tuple(x=0, y=0, z=0)
+
+    report = memory_report(lambda: [Tuple(x=1, y=2, z=3) for _ in range(20_000)])
+    baseline = memory_report(lambda: [Point(x=1, y=2, z=3) for _ in range(20_000)])
+    assert report.records == baseline.records == 20_000
+    assert report.shallow == baseline.shallow
+    assert report.per_record <= baseline.per_record * 1.05
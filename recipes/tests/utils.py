@@ -0,0 +1,66 @@
+# 10/19/26
+# tests/utils.py
+import os
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+from .. import fast_mode, pipefunc, Guard, Tuple
+from ..utils import require, options
+
+@pytest.fixture
+def fast():
+    previous = fast_mode()
+    yield fast_mode(True)
+    fast_mode(previous)
+
+def test_require():
+    require(True)
+    with pytest.raises(ValueError):
+        require(False, ValueError())
+
+def test_fast_mode_switch(fast):
+    assert fast and options.fast
+    assert fast_mode(False) is False
+    assert fast_mode() is False
+    assert fast_mode(True) is True
+
+def test_fast_mode_require(fast):
+    require(False, ValueError())
+
+def test_fast_mode_function(fast):
+    @pipefunc
+    def inc(x):
+        return x + 1
+
+    with pytest.raises(TypeError):
+        pipefunc(None)
+    # validated at construction only
+    inc._func = None
+    assert inc.func is None
+
+def test_fast_mode_guard(fast):
+    guarded = Guard(0, int)
+    guarded._guard = ...
+    assert guarded.guard is ...
+    fast_mode(False)
+    with pytest.raises(TypeError):
+        guarded.guard
+
+def test_fast_mode_tuple(fast):
+    assert Tuple(_x=1)._fields == ("_x",)
+    assert type(Tuple(_x=1)) is type(Tuple(_x=2))
+    for reserved in ("_fields", "_size", "_template", "_make", "__slots__"):
+        with pytest.raises(AttributeError):
+            Tuple(**{reserved: 1})
+    fast_mode(False)
+    with pytest.raises(AttributeError):
+        Tuple(_x=1)
+
+def test_fast_mode_environment():
+    root = Path(__file__).parents[2]
+    env = {**os.environ, "RECIPES_FAST": "1"}
+    statement = "from recipes import fast_mode; print(fast_mode())"
+    result = subprocess.run([sys.executable, "-c", statement], capture_output=True,
+            text=True, check=True, cwd=root, env=env)
+    assert result.stdout.strip() == "True"
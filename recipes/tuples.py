@@ -1,10 +1,110 @@
 # 03/11/22
 # tuples.py
 from __future__ import annotations
-from typing import Iterable, Any
+from operator import itemgetter
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Callable, Iterable, Any
+
+from .utils import options
 
 Identifier = str
 
+class TupleFactory(tuple):
+    """Base class of anonymous tuples.
+
+    A subclass is created once per shape, that is the number of unnamed fields
+    and the names of the named fields, and holds the schema metadata. Instances
+    only hold the tuple payload.
+    """
+    __slots__ = ()
+
+    _fields: tuple[int | Identifier, ...] = ()
+    _size = 0
+    _template = "()"
+
+    def __new__(cls, *args: Any, **kwargs: Any):
+        return anonymous_tuple(*args, **kwargs)
+
+    @classmethod
+    def _make(cls, values: Iterable[Any]) -> TupleFactory:
+        "Creates a tuple of this shape from values, without validating its length."
+        return tuple.__new__(cls, values)
+
+    @property
+    def _unnamed(self) -> tuple[Any, ...]:
+        return tuple.__getitem__(self, slice(self._size))
+
+    @property
+    def _named(self) -> tuple[tuple[Identifier, Any], ...]:
+        return tuple(zip(self._fields[self._size:], self[self._size:]))
+
+    def __repr__(self):
+        return self._template.format(*self)
+
+    def _items(self):
+        return zip(self._fields, self)
+
+    def _asdict(self):
+        return dict(zip(self._fields, self))
+
+    def __setattr__(self, attr: Identifier, value: Any):
+        if not hasattr(self, attr):
+            raise AttributeError(f"type object 'Tuple' has not attribute '{attr}'")
+        raise TypeError(f"cannot set '{attr}' attribute of immutable type 'Tuple'")
+
+    def __hash__(self):
+        return hash((self._fields, tuple.__hash__(self)))
+
+    def __reduce__(self):
+        return _restore, (self._size, self._fields[self._size:], tuple(self))
+
+# tuple classes by shape, shapes with private fields are only used in fast mode
+_shapes: dict[tuple[int, tuple[Identifier, ...]], type[TupleFactory]] = {}
+_private_shapes: dict[tuple[int, tuple[Identifier, ...]], type[TupleFactory]] = {}
+
+# names used by the schema and methods of TupleFactory, which fields may not shadow
+RESERVED = frozenset(name for name in vars(TupleFactory) if name.startswith("_"))
+
+def tuple_class(size: int, names: tuple[Identifier, ...]) -> type[TupleFactory]:
+    """Returns the anonymous tuple class with `size` unnamed fields followed by
+    the named fields `names`."""
+    cls = _shapes.get((size, names))
+    if cls is not None:
+        return cls
+    private = [name for name in names if name.startswith("_")]
+    shapes = _shapes
+    if private:
+        reserved = [name for name in private if name in RESERVED or name.startswith("__")]
+        if reserved:
+            raise AttributeError(f"reserved fields are not allowed, got: '{reserved[0]}'")
+        if not options.fast:
+            raise AttributeError(f"private fields are not allowed, got: '{private[0]}'")
+        shapes = _private_shapes
+        cls = shapes.get((size, names))
+        if cls is not None:
+            return cls
+
+    fields = tuple(range(size)) + names
+    namespace = {
+        "__slots__": (),
+        "_fields": fields,
+        "_size": size,
+        "_template": "({})".format(", ".join(["{}"] * size + [f"{_escape(name)}={{}}" for name in names])),
+    }
+    for index, name in enumerate(names, size):
+        namespace[name] = property(itemgetter(index))
+    cls = shapes[size, names] = type("TupleFactory", (TupleFactory,), namespace)
+    return cls
+
+def _escape(name: Identifier) -> str:
+    "Escapes braces in a field name so it is written literally by the repr template."
+    return name.replace("{", "{{").replace("}", "}}")
+
+def _restore(size: int, names: tuple[Identifier, ...], values: tuple[Any, ...]) -> TupleFactory:
+    return tuple_class(size, names)._make(values)
+
 def anonymous_tuple(*fields, **named_fields) -> "TupleFactory":
     """Anonymous tuple class factory function.
 
@@ -24,46 +124,8 @@ def anonymous_tuple(*fields, **named_fields) -> "TupleFactory":
         1, 2, 3
 
     """
-    class TupleFactory(tuple):
-        def __new__(cls, *args: Any, **kwargs: dict[Identifier, Any]):
-            cls._unnamed = args
-            cls._named = tuple(kwargs.items())
-            cls._fields = tuple(range(len(args))) + tuple(kwargs)
-            for attr, value in kwargs.items():
-                if attr.startswith("_"):
-                    raise AttributeError(f"private fields are not allowed, got: '{attr}'")
-                setattr(cls, attr, value)
-            cls._init = True
-            return tuple.__new__(TupleFactory, args + tuple(kwargs.values()))
-
-        def __repr__(self):
-            rep = ", ".join(
-                    f"{field}={value}"
-                if not
-                    isinstance(field, int)
-                else
-                    str(value)
-                for field, value
-                    in self._items())
-            return f"({rep})"
-
-        def _items(self):
-            yield from zip(self._fields, self)
-
-        def _asdict(self):
-            return dict(self._items())
-
-        def __setattr__(self, attr: Identifier, value: Any):
-            if hasattr(self, "_init") and not hasattr(self, attr):
-                raise AttributeError(f"type object 'Tuple' has not attribute '{attr}'")
-            if hasattr(self, "_init"):
-                raise TypeError(f"cannot set '{attr}' attribute of immutable type 'Tuple'")
-            object.__setattr__(self, attr, value)
-
-        def __hash__(self):
-            return hash(tuple(self._items()))
-
-    return TupleFactory(*fields, **named_fields)
+    cls = tuple_class(len(fields), tuple(named_fields))
+    return tuple.__new__(cls, fields + tuple(named_fields.values()))
 
 # Helper class for test compatibility.
 class Tuple:
@@ -78,3 +140,37 @@ def fields(cls):
 
 def asdict(cls):
     return cls._asdict()
+
+def memory_report(build: Callable[[], Iterable[Any]]) -> TupleFactory:
+    """Measures the memory used by the records created by `build`.
+
+    `traced` is the memory allocated by tracemalloc while building the records,
+    excluding the list holding them, and `shallow` is the sum of sys.getsizeof
+    over the records. Record classes are counted once in `schema`.
+
+    Examples:
+        >>> report = memory_report(lambda: [Tuple(x=1, y=2) for _ in range(100_000)])
+        >>> report.per_record
+        64.0
+    """
+    import sys
+    import tracemalloc
+
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        records = list(build())
+        traced = tracemalloc.get_traced_memory()[0] - before - sys.getsizeof(records)
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+    count = len(records)
+    shallow = sum(map(sys.getsizeof, records))
+    schema = sum(sys.getsizeof(cls) for cls in {type(record) for record in records})
+    return anonymous_tuple(
+        records=count, traced=traced, shallow=shallow, schema=schema,
+        per_record=traced / count if count else 0.0,
+    )
@@ -1,5 +1,7 @@
 # 03/26/22
 # utils.py
+import os
+import sys
 
 def singleton(cls):
     cls.new = cls
@@ -12,6 +14,40 @@ class Nil:
     def __bool__(self):
         return False
 
+@singleton
+class options:
+    """Package wide options.
+
+    In fast mode runtime checks are skipped, similarly to running with `python -O`
+    but without affecting other packages. It is enabled by setting the RECIPES_FAST
+    environment variable, or with `fast_mode(True)`.
+    """
+    fast = os.environ.get("RECIPES_FAST", "") not in ("", "0")
+
+    def __repr__(self):
+        return f"options(fast={self.fast})"
+
+def fast_mode(enabled=None):
+    "Returns whether fast mode is enabled, after enabling or disabling it if specified."
+    if enabled is not None:
+        options.fast = bool(enabled)
+    return options.fast
+
 def require(predicate, error=Exception()):
-    if not predicate:
+    if not predicate and not options.fast:
         raise error
+
+def lookup(obj):
+    "Returns the object found at the module and qualified name of obj, or None."
+    module = sys.modules.get(getattr(obj, "__module__", None))
+    for attr in getattr(obj, "__qualname__", "<locals>").split("."):
+        module = getattr(module, attr, None)
+    return module
+
+def resolve(module, qualname):
+    "Imports module and returns the object found at qualname, used for unpickling."
+    import importlib
+    obj = importlib.import_module(module)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+    return obj